@@ -6,18 +6,28 @@ import time
 import html as _html
 import threading
 import logging
-import calendar
 import secrets
 import requests
 
 from datetime import datetime
-from collections import defaultdict
-from functools import wraps
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache, wraps
 
-from flask import Flask, render_template, jsonify, abort, request, redirect, url_for
+from flask import Flask, render_template, abort, request, redirect, url_for, send_from_directory, g
 from mohawk import Receiver
 from mohawk.exc import HawkFail
 
+try:
+    import orjson
+except ImportError:  # optional speedup (pip install .[fast]), fall back to stdlib json
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: article index writes are only serialized per process
+    fcntl = None
+
 app = Flask(__name__, template_folder='templates')
 
 # --- Logging setup ---
@@ -28,11 +38,29 @@ if not logger.handlers:
     logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# --- JSON helpers ---
+def json_loads(data):
+    """Decode JSON from bytes or str, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 # --- Nonce store for HAWK replay protection ---
-# Simple in-memory nonce store with TTL.
-_nonce_store = {}
-_nonce_lock = threading.Lock()
+# Simple in-memory nonce store with TTL, split into shards with their own lock
+# so concurrent requests rarely wait on each other. The TTL is constant, so
+# each shard's expiry deque is in expiry order and expired nonces are always
+# at its left end.
+_NONCE_SHARDS = 16  # power of two, shard = hash & (shards - 1)
+# each shard: (set of keys, deque of (expires_at, key), lock)
+_nonce_shards = [(set(), deque(), threading.Lock()) for _ in range(_NONCE_SHARDS)]
 NONCE_TTL = int(os.environ.get('HAWK_NONCE_TTL', '60'))  # seconds
+NONCE_MAX = int(os.environ.get('HAWK_NONCE_MAX', '4096'))  # entries, across all shards
 
 def seen_nonce(credentials_id, nonce, ts=None):
     """Called by mohawk.Receiver with (credentials_id, nonce, ts).
@@ -41,23 +69,32 @@ def seen_nonce(credentials_id, nonce, ts=None):
     """
     now = time.time()
     key = f"{credentials_id}:{nonce}"
-    with _nonce_lock:
-        # cleanup expired
-        expired = [n for n, exp in _nonce_store.items() if exp < now]
-        for n in expired:
-            del _nonce_store[n]
-
-        if key in _nonce_store:
+    nonces, expiry, lock = _nonce_shards[hash(key) & (_NONCE_SHARDS - 1)]
+    with lock:
+        # cleanup expired, oldest first
+        while expiry and expiry[0][0] < now:
+            _, n = expiry.popleft()
+            nonces.discard(n)
+
+        if key in nonces:
             # already seen
             return True
 
+        # keep memory bounded, evicting the shard's oldest nonce
+        if len(nonces) >= max(1, NONCE_MAX // _NONCE_SHARDS):
+            _, n = expiry.popleft()
+            nonces.discard(n)
+
         # mark nonce as seen until TTL
-        _nonce_store[key] = now + NONCE_TTL
+        nonces.add(key)
+        expiry.append((now + NONCE_TTL, key))
         return False
 
 # --- Simple in-memory rate limiter ---
-_rate_store = {}
-_rate_lock = threading.Lock()
+# Sharded like the nonce store; keys are per (client, endpoint).
+_RATE_SHARDS = 16  # power of two, shard = hash & (shards - 1)
+_rate_stores = [{} for _ in range(_RATE_SHARDS)]
+_rate_locks = [threading.Lock() for _ in range(_RATE_SHARDS)]
 
 def rate_limit(max_requests: int = 10, window_seconds: int = 60):
     def decorator(f):
@@ -67,10 +104,15 @@ def rate_limit(max_requests: int = 10, window_seconds: int = 60):
             client = request.remote_addr or 'unknown'
             key = f"{client}:{request.endpoint}"
             now = time.time()
-            with _rate_lock:
-                count, reset = _rate_store.get(key, (0, now + window_seconds))
+            shard = hash(key) & (_RATE_SHARDS - 1)
+            rate_store = _rate_stores[shard]
+            with _rate_locks[shard]:
+                count, reset = rate_store.get(key, (0, 0))
                 if now > reset:
-                    # window expired
+                    # new or expired window; also drop other expired windows in
+                    # this shard so the store does not grow without bound
+                    for k in [k for k, (_, r) in rate_store.items() if now > r]:
+                        del rate_store[k]
                     count = 0
                     reset = now + window_seconds
 
@@ -78,7 +120,7 @@ def rate_limit(max_requests: int = 10, window_seconds: int = 60):
                     # too many requests
                     abort(429)
 
-                _rate_store[key] = (count + 1, reset)
+                rate_store[key] = (count + 1, reset)
 
             return f(*args, **kwargs)
 
@@ -100,41 +142,47 @@ def set_security_headers(response):
 
 
 # --- Article sanitizer ---
+_HTML_SPECIAL_RE = re.compile('[<>&]')
+
 def sanitize_text(s: str) -> tuple[str, bool]:
     """Escape HTML special chars in string s. Returns (sanitized_string, changed_flag)."""
     if not isinstance(s, str):
         return s, False
-    if '<' in s or '>' in s or '&' in s:
-        return _html.escape(s), True
-    return s, False
+    # one scan for all three characters
+    if _HTML_SPECIAL_RE.search(s) is None:
+        return s, False
+    return _html.escape(s), True
 
 
 def sanitize_article_data(obj):
-    """Recursively sanitize all string fields inside article JSON-like structure.
+    """Sanitize all string fields inside article JSON-like structure in place.
+    Walks it with an explicit stack, so deeply nested input cannot hit the
+    recursion limit, and only writes back strings that actually changed.
     Returns (sanitized_obj, changed_flag)
     """
+    if not isinstance(obj, (dict, list)):
+        return sanitize_text(obj)
+
     changed = False
-    if isinstance(obj, dict):
-        new = {}
-        for k, v in obj.items():
-            sv, ch = sanitize_article_data(v)
-            new[k] = sv
-            changed = changed or ch
-        return new, changed
-    elif isinstance(obj, list):
-        new_list = []
-        for item in obj:
-            sv, ch = sanitize_article_data(item)
-            new_list.append(sv)
-            changed = changed or ch
-        return new_list, changed
-    elif isinstance(obj, str):
-        s2, ch = sanitize_text(obj)
-        return s2, ch
-    else:
-        return obj, False
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        for key, value in (node.items() if isinstance(node, dict) else enumerate(node)):
+            if isinstance(value, str):
+                sv, ch = sanitize_text(value)
+                if ch:
+                    # replacing an existing key/index is safe while iterating
+                    node[key] = sv
+                    changed = True
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return obj, changed
 
 ARTICLES_DIR = 'articles'
+# Resolved once for path containment checks; a path is inside ARTICLES_DIR if
+# it starts with one of these prefixes
+_ARTICLES_DIR_ABS = os.path.abspath(ARTICLES_DIR) + os.sep
+_ARTICLES_DIR_REAL = os.path.realpath(ARTICLES_DIR) + os.sep
 CREDENTIALS = {
     "billard": {
         "id": "billard", 
@@ -159,14 +207,15 @@ def require_hawk_auth(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
+        body, content_type = content_handler(None)
         try:
             Receiver(
                 credentials_map=lookup_credentials,
                 request_header=request.headers.get("Authorization"),
                 url=request.url,
                 method=request.method,
-                content=content_handler(None)[0],
-                content_type=content_handler(None)[1],
+                content=body,
+                content_type=content_type,
                 seen_nonce=seen_nonce,
             )
         except HawkFail as e:
@@ -174,88 +223,308 @@ def require_hawk_auth(f):
             abort(401)
 
         logger.info('HAWK auth success: %s %s %s', request.remote_addr, request.method, request.path)
+        # keep the verified body for the route, see get_json_body()
+        g.request_body = body
         return f(*args, **kwargs)
     
     return decorated_function
 
+def get_json_body():
+    """
+    Parse the JSON body read during HAWK auth, instead of having
+    request.get_json() fetch and decode it again
+    """
+    if not request.is_json:
+        abort(415)
+    try:
+        return json_loads(g.request_body)
+    except ValueError:
+        abort(400)
+
 def parse_article_filename(filename):
     """
     Parse article filename in format: name_month-day.json
     Returns (name, month, day) or None if invalid format
     """
-    if not filename.endswith('.json'):
+    # Cheap rejects for directory noise: dotfiles (including upload temp files)
+    # and anything shorter than the smallest valid name, a_1-1.json
+    if filename.startswith('.') or len(filename) < 10 or not filename.endswith('.json'):
         return None
     
-    # Remove .json extension
-    name_without_ext = filename[:-5]
-    
-    if len(name_without_ext) > 20:
-        name_without_ext = name_without_ext[:20]
+    # Remove .json extension and split off the trailing _month-day
+    name, sep, month_day = filename[:-5].rpartition('_')
+    # name is capped at the 20 chars upload() allows
+    if not sep or not 1 <= len(name) <= 20:
+        return None
 
-    # Match pattern: name_month-day
-    match = re.match(r'^(.+)_(\d{1,2})-(\d{1,2})$', name_without_ext)
-    if match:
-        name, month, day = match.groups()
+    month, _, day = month_day.partition('-')
+    if (month.isdecimal() and day.isdecimal()
+            and 1 <= len(month) <= 2 and 1 <= len(day) <= 2):
         return (name.lower(), int(month), int(day))
     return None
 
-def get_all_articles():
+# Current year, refreshed at most once a minute
+_NOW_CACHE = {'ts': float('-inf'), 'year': 0}
+
+def get_current_year():
+    """Return the current year without calling datetime.now() on every use"""
+    now = time.monotonic()
+    if now - _NOW_CACHE['ts'] >= 60:
+        _NOW_CACHE['year'] = datetime.now().year
+        _NOW_CACHE['ts'] = now
+    return _NOW_CACHE['year']
+
+_MONTH_ABBR = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+@lru_cache(maxsize=512)
+def format_date_str(month, day):
+    """Format date as "MMM, DD" (e.g., "Dec, 24")"""
+    return f"{_MONTH_ABBR[month]}, {day:02d}"
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Month DD, YYYY; like strptime('%B %d, %Y') any run of whitespace is accepted
+# where the format has a space. ASCII digits and whitespace only. match() also
+# accepts the upload time appended after it
+_DATE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})', re.ASCII)
+
+def parse_header_date(date_str):
     """
-    Scan the articles directory and return list of articles with metadata
-    Returns list of dicts with: filename, name, month, day, date_str, title, year
+    Parse article header date in format: Month DD, YYYY
+    Returns (year, month, day) or None if invalid format
     """
-    articles = []
-    current_year = datetime.now().year
-    
-    if not os.path.exists(ARTICLES_DIR):
-        return articles
-    
-    for filename in os.listdir(ARTICLES_DIR):
-        parsed = parse_article_filename(filename)
-        if parsed:
-            name, month, day = parsed
-            
-            # Load the JSON to get the actual title and date
-            filepath = os.path.join(ARTICLES_DIR, filename)
+    match = _DATE_RE.fullmatch(date_str)
+    month = match and _MONTHS.get(match.group(1).lower())
+    if not month:
+        return None
+
+    year, day = int(match.group(3)), int(match.group(2))
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        # e.g. February 30
+        return None
+    return (year, month, day)
+
+# --- Article index ---
+# .articles_index.json maps filename -> article list entry so page views do not
+# have to open every article. It is reconciled with the directory listing
+# whenever the article list is reloaded (after upload()/remove() or any other
+# change to the directory), so files added or deleted by hand are picked up too.
+# Updates hold a lock on ARTICLES_INDEX_LOCK so gunicorn workers take turns.
+# Both files live next to ARTICLES_DIR rather than in it: writing them must not
+# change the directory mtime the article list cache is keyed on.
+_ARTICLES_PARENT = os.path.dirname(os.path.abspath(ARTICLES_DIR))
+ARTICLES_INDEX = os.path.join(_ARTICLES_PARENT, '.articles_index.json')
+ARTICLES_INDEX_LOCK = os.path.join(_ARTICLES_PARENT, '.articles_index.lock')
+_index_lock = threading.Lock()
+
+@contextmanager
+def articles_index_lock():
+    """
+    Hold the article index lock: a thread lock plus, where fcntl is available,
+    an exclusive flock() on ARTICLES_INDEX_LOCK shared with other workers.
+    """
+    with _index_lock:
+        fd = None
+        if fcntl is not None:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    title = data.get('header', {}).get('mainHeader', name.replace('_', ' ').title())
-                    
-                    # Try to parse year from the full date in the header
-                    full_date = data.get('header', {}).get('date', '')
-                    year = current_year
-                    if full_date:
-                        try:
-                            parsed_date = datetime.strptime(full_date, '%B %d, %Y')
-                            year = parsed_date.year
-                        except:
-                            pass
-                    
-                    # Format date as "MMM, DD" (e.g., "Dec, 24")
-                    month_name = calendar.month_abbr[month]
-                    date_str = f"{month_name}, {day:02d}"
-                    
-            except:
-                title = "Failed to load article title :("
-                month_name = calendar.month_abbr[month]
-                date_str = f"{month_name}, {day:02d}"
-                year = current_year
-            
-            articles.append({
-                'filename': filename,
-                'slug': name,
-                'month': month,
-                'day': day,
-                'date_str': date_str,
-                'title': title,
-                'year': year
-            })
-    
+                fd = os.open(ARTICLES_INDEX_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            except OSError as e:
+                # e.g. read-only deployment, where nothing writes the index anyway
+                logger.warning('Failed to lock article index: %s', e)
+        try:
+            yield
+        finally:
+            if fd is not None:
+                # Closing the descriptor releases the flock
+                os.close(fd)
+
+def read_articles_index():
+    """Return the article index dict, or None if it is missing or unreadable"""
+    try:
+        with open(ARTICLES_INDEX, 'rb') as f:
+            index = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return index if isinstance(index, dict) else None
+
+def write_articles_index(index):
+    """Atomically write the article index file"""
+    temp_fd, temp_path = tempfile.mkstemp(dir=_ARTICLES_PARENT, prefix=".articles_index-", suffix=".tmp")
+    try:
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(json_dumps(index))
+        os.replace(temp_path, ARTICLES_INDEX)
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except Exception:
+                pass
+
+def sync_articles_index():
+    """
+    Reconcile the index with the articles directory listing: files that are new
+    or whose mtime changed are (re)loaded, entries whose file is gone are
+    dropped. Unchanged files are only stat()ed. The index is saved if it
+    changed. Returns the article list.
+    """
+    with articles_index_lock():
+        index = read_articles_index() or {}
+        synced = {}
+        changed = False
+
+        try:
+            it = os.scandir(ARTICLES_DIR)
+        except OSError:
+            return []
+
+        with it:
+            for entry in it:
+                if not entry.is_file() or not parse_article_filename(entry.name):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                art = index.get(entry.name)
+                if art is None or art.get('mtime_ns') != mtime:
+                    art = load_article_entry(entry.name, entry.path)
+                    art['mtime_ns'] = mtime
+                    changed = True
+                synced[entry.name] = art
+
+        if changed or synced.keys() != index.keys():
+            try:
+                write_articles_index(synced)
+            except OSError as e:
+                # e.g. read-only deployment; keep serving from the scan
+                logger.warning('Failed to write article index: %s', e)
+        return list(synced.values())
+
+# --- Article list cache ---
+# Keep the last load and reuse it while the articles directory mtime stays the
+# same; adding, removing or replacing a file (as upload() does) changes it.
+# Across gunicorn workers the index file is the shared copy; each worker
+# reloads once per change. The TTL is a ceiling for changes the dir mtime does
+# not reflect, i.e. article files edited in place: the reload compares each
+# file's mtime with the one recorded in the index and rereads the changed ones.
+ARTICLES_CACHE_TTL = max(1, int(os.environ.get('ARTICLES_CACHE_TTL', '300')))  # seconds
+
+@lru_cache(maxsize=1)
+def _load_articles(mtime_ns, ttl_bucket):
+    """
+    Load the article list from the index, reconciled with the directory.
+    mtime_ns and ttl_bucket are only the cache key: a change in either means
+    a reload.
+    """
+    articles = sync_articles_index()
+    # Articles without a dated header are filed under the current year. It is
+    # filled in here rather than stored in the index, which would freeze it.
+    current_year = get_current_year()
+    articles = [art if art['year'] is not None else dict(art, year=current_year)
+                for art in articles]
     # Sort by year (descending), then month (descending), then day (descending)
     articles.sort(key=lambda x: (x['year'], x['month'], x['day']), reverse=True)
-    
-    return articles
+
+    # The newest article wins when several share a slug. Paths are resolved
+    # here, once per reload, rather than on every article request
+    by_slug = {}
+    for art in articles:
+        if art['slug'] not in by_slug:
+            by_slug[art['slug']] = (art['filename'], _ARTICLES_DIR_ABS + art['filename'])
+
+    # Validator for pages built from the list: files edited in place change
+    # their own mtime but not the directory's
+    return {
+        "mtime": max([mtime_ns] + [art['mtime_ns'] for art in articles]),
+        "data": articles,
+        "by_slug": by_slug,
+        "latest": articles[0] if articles else None,
+        "by_year": group_articles_by_year(articles),
+    }
+
+def invalidate_articles_cache():
+    """Force the next get_all_articles() call to reload the article list"""
+    _load_articles.cache_clear()
+
+def load_articles_cache():
+    """
+    Return the cache dict (mtime, data, by_slug, latest, by_year), reloading
+    it when the articles directory mtime changed or the TTL ran out. mtime is
+    the newest of the directory and article file mtimes.
+    """
+    try:
+        mtime = os.stat(ARTICLES_DIR).st_mtime_ns
+    except OSError:
+        return {"mtime": 0, "data": [], "by_slug": {}, "latest": None, "by_year": {}}
+    return _load_articles(mtime, int(time.monotonic() // ARTICLES_CACHE_TTL))
+
+def get_all_articles():
+    """Return list of articles with metadata, newest first"""
+    return load_articles_cache()["data"]
+
+def get_slug_index():
+    """Return dict mapping article slug -> (filename, absolute path)"""
+    return load_articles_cache()["by_slug"]
+
+def resolve_article(slug):
+    """Return (filename, absolute path) of the article for slug, or None"""
+    return get_slug_index().get(slug.lower())
+
+def get_latest_article():
+    """Return the newest article entry, or None if there are no articles"""
+    return load_articles_cache()["latest"]
+
+def build_article_entry(filename, data):
+    """
+    Build the article list entry for filename from its parsed JSON data
+    Returns dict with: filename, slug, month, day, date_str, title, year
+    (None when the header has no date; see _load_articles)
+    """
+    name, month, day = parse_article_filename(filename)
+
+    header = data.get('header', {})
+    title = header.get('mainHeader', name.replace('_', ' ').title())
+
+    # Take the year from the full date in the header ("Month DD, YYYY", with
+    # the upload time appended for uploaded articles)
+    match = _DATE_RE.match(header.get('date', ''))
+    year = int(match.group(3)) if match else None
+
+    return {
+        'filename': filename,
+        'slug': name,
+        'month': month,
+        'day': day,
+        'date_str': format_date_str(month, day),
+        'title': title,
+        'year': year
+    }
+
+def load_article_entry(filename, path):
+    """
+    Open the article file at path and build its list entry (see
+    build_article_entry). Unreadable files get a placeholder title.
+    """
+    # Load the JSON to get the actual title and date
+    try:
+        with open(path, 'rb') as f:
+            data = json_loads(f.read())
+        return build_article_entry(filename, data)
+    except Exception:
+        name, month, day = parse_article_filename(filename)
+        return {
+            'filename': filename,
+            'slug': name,
+            'month': month,
+            'day': day,
+            'date_str': format_date_str(month, day),
+            'title': "Failed to load article title :(",
+            'year': None
+        }
 
 def group_articles_by_year(articles):
     """Group articles by year for the work page"""
@@ -266,62 +535,116 @@ def group_articles_by_year(articles):
     # Sort years in descending order
     return dict(sorted(grouped.items(), reverse=True))
 
+def _get_build_mtime_ns():
+    """Newest mtime of this file and the templates, i.e. of the deployed code"""
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    mtimes = [os.stat(__file__).st_mtime_ns]
+    with os.scandir(template_dir) as it:
+        mtimes.extend(entry.stat().st_mtime_ns for entry in it if entry.is_file())
+    return max(mtimes)
+
+# Pages depend on the code and templates as well as the articles, so a redeploy
+# must not leave browsers revalidating stale HTML against unchanged articles
+_BUILD_MTIME_NS = _get_build_mtime_ns()
+
+def conditional_response(mtime_ns, render):
+    """
+    Build a response carrying an ETag/Last-Modified derived from mtime_ns and
+    the build mtime, with the body produced by render(). If the client's cached
+    copy is still current, answer 304 without calling render() at all.
+    """
+    response = app.response_class()
+    response.set_etag(f"{_BUILD_MTIME_NS:x}-{mtime_ns:x}")
+    response.last_modified = max(mtime_ns, _BUILD_MTIME_NS) // 1_000_000_000
+    # Always revalidate (cheaply, via the validators above) rather than letting
+    # browsers reuse the page on heuristic freshness derived from Last-Modified
+    response.cache_control.no_cache = True
+    response.make_conditional(request)
+    if response.status_code != 304:
+        response.set_data(render())
+    return response
+
+def render_conditional(mtime_ns, template, **context):
+    """Render template via conditional_response()"""
+    return conditional_response(mtime_ns, lambda: render_template(template, **context))
+
+@lru_cache(maxsize=512)
+def render_article_page(slug):
+    """
+    Render the article page shell for slug. It only depends on the slug (the
+    article itself is fetched client-side), so the rendered HTML is reused.
+    """
+    return render_template('article.html',
+                           article_data_url=url_for('article_data', slug=slug))
+
 @app.route('/')
 def home():
     """Home page - shows only the latest article"""
-    articles = get_all_articles()
-    latest_article = articles[0] if articles else None
-    return render_template('home.html', latest_article=latest_article)
+    return render_template('home.html', latest_article=get_latest_article())
 
 @app.route('/article/<slug>')
 def article(slug):
     """
-    Article page - loads article data from JSON and renders article.html template.
-    Slugs and filenames are normalized to lowercase.
+    Article page - renders article.html, which fetches the article JSON from
+    article_data(). Slugs and filenames are normalized to lowercase.
     """
     # Normalize requested slug to lowercase
     req_slug = slug.lower()
 
-    # Find the article file matching this slug
-    articles = get_all_articles()
-    article_data = None
+    resolved = resolve_article(req_slug)
+    if resolved is None:
+        abort(404)
 
-    for art in articles:
-        if art.get('slug') == req_slug:
-            filepath = os.path.join(ARTICLES_DIR, art['filename'])
-            # Defensively ensure the filepath resolves inside ARTICLES_DIR
-            fullpath = os.path.abspath(filepath)
-            allowed_dir = os.path.abspath(ARTICLES_DIR)
-            if not fullpath.startswith(allowed_dir + os.sep) and fullpath != allowed_dir:
-                # suspicious path, skip
-                continue
-            with open(fullpath, 'r', encoding='utf-8') as f:
-                article_data = json.load(f)
-            break
+    try:
+        mtime = os.stat(resolved[1]).st_mtime_ns
+    except OSError:
+        abort(404)
 
-    if not article_data:
+    return conditional_response(mtime, lambda: render_article_page(req_slug))
+
+@app.route('/article/<slug>/data.json')
+def article_data(slug):
+    """Article JSON, sent straight from disk with ETag/Last-Modified support"""
+    resolved = resolve_article(slug)
+    if resolved is None:
         abort(404)
 
-    # Render the article template with the parsed dict; use Jinja's tojson() in template
-    return render_template('article.html', article_json=article_data)
+    # send_from_directory() refuses paths escaping ARTICLES_DIR
+    return send_from_directory(_ARTICLES_DIR_ABS, resolved[0],
+                               mimetype='application/json', conditional=True)
 
 @app.route('/work')
 def work():
     """Work/archive page - lists all articles grouped by year"""
-    articles = get_all_articles()
-    articles_by_year = group_articles_by_year(articles)
-    return render_template('work.html', articles_by_year=articles_by_year)
+    cache = load_articles_cache()
+    return render_conditional(cache["mtime"], 'work.html', articles_by_year=cache["by_year"])
 
 @app.route('/contact')
 def contact():
     """Contact page"""
     return render_template('contact.html')
 
+# Characters not allowed in article names / filenames passed to remove()
+_NAME_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_\-]")
+_FILENAME_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_\-\.]+")
+
+# Pre-serialized admin API replies (same bytes jsonify() would produce). A new
+# Response is still built per request since after_request mutates its headers.
+_OK_BODY = b'{"ok":true}\n'
+_UPLOAD_OK_BODY = {
+    False: b'{"ok":true,"sanitized":false}\n',
+    True: b'{"ok":true,"sanitized":true}\n',
+}
+
+def json_reply(body, status):
+    """Wrap pre-serialized JSON bytes in a response"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
 @app.post("/admin/upload")
 @require_hawk_auth
 @rate_limit(max_requests=5, window_seconds=60)
 def upload():
-    article_data = request.get_json()
+    article_data = get_json_body()
     if not article_data:
         abort(400)
     
@@ -329,17 +652,15 @@ def upload():
     # Use mainHeader as the article title for filename, fallback to name, fallback to 'untitled'
     raw_name = header.get('mainHeader') or header.get('name') or 'untitled'
     # allow only alphanum, underscore and hyphen in filenames
-    name = re.sub(r"[^A-Za-z0-9_\-]", "_", raw_name).strip('_') or 'untitled'
+    name = _NAME_SANITIZE_RE.sub("_", raw_name).strip('_') or 'untitled'
     name = name.lower()
     date_str = header.get('date', '')
-    try:
-        date_obj = datetime.strptime(date_str, '%B %d, %Y')
-        month = date_obj.month
-        day = date_obj.day
-    except:
+    parsed_date = parse_header_date(date_str)
+    if parsed_date:
+        _, month, day = parsed_date
+    else:
         month = 1
         day = 1
-        date_obj = datetime(datetime.now().year, month, day)
     
     if len(name) > 20:
         name = name[:20]
@@ -347,23 +668,30 @@ def upload():
     filename = f"{name}_{month}-{day}.json".lower()
     os.makedirs(ARTICLES_DIR, exist_ok=True)
     # Change article data upload date, add upload time
-    article_data['header']['date'] = article_data['header'].get('date', '') + " " + datetime.now().strftime('%H:%M:%S')
-
-    # Sanitize article content to avoid HTML/script injection in stored articles
-    sanitized_article, changed = sanitize_article_data(article_data)
+    article_data['header']['date'] = article_data['header'].get('date', '') + " " + time.strftime('%H:%M:%S')
+
+    # Sanitize article content to avoid HTML/script injection in stored articles.
+    # <, > and & can only reach a string literally or as a \uXXXX escape, so a
+    # UTF-8 body containing neither has nothing to escape and the walk is
+    # skipped. NUL bytes mean UTF-16/32, where the byte checks do not apply.
+    raw_body = g.request_body
+    if (b'<' in raw_body or b'>' in raw_body or b'&' in raw_body
+            or b'\\u' in raw_body or b'\x00' in raw_body):
+        sanitized_article, changed = sanitize_article_data(article_data)
+    else:
+        sanitized_article, changed = article_data, False
     if changed:
         logger.info('Article upload sanitized for name=%s date=%s client=%s', name, date_str, request.remote_addr)
 
     # Write atomically: write sanitized content to a temp file in the articles dir then replace
     temp_fd, temp_path = tempfile.mkstemp(dir=ARTICLES_DIR, prefix=".upload-", suffix=".tmp")
     try:
-        with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-            json.dump(sanitized_article, f, ensure_ascii=False, indent=2)
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(json_dumps(sanitized_article))
         final_path = os.path.join(ARTICLES_DIR, filename.lower())
         final_abs_path = os.path.abspath(final_path)
-        allowed_dir = os.path.abspath(ARTICLES_DIR)
         # Ensure the resolved path is inside the articles directory using a robust containment check
-        if not final_abs_path.startswith(allowed_dir + os.sep) and final_abs_path != allowed_dir:
+        if not final_abs_path.startswith(_ARTICLES_DIR_ABS):
             abort(400)
         os.replace(temp_path, final_path)
     finally:
@@ -374,13 +702,14 @@ def upload():
             except Exception:
                 pass
 
-    return jsonify({"ok": True, "sanitized": bool(changed)}), 201
+    invalidate_articles_cache()
+    return json_reply(_UPLOAD_OK_BODY[bool(changed)], 201)
 
 @app.post("/admin/remove")
 @require_hawk_auth
 @rate_limit(max_requests=5, window_seconds=60)
 def remove():
-    data = request.get_json()
+    data = get_json_body()
     if not data or 'filename' not in data:
         abort(400)
     filename = data['filename']
@@ -388,23 +717,25 @@ def remove():
     if '/' in filename or '\\' in filename or '..' in filename:
         abort(400)
     # sanitize further: only allow simple filenames
-    filename = re.sub(r"[^A-Za-z0-9_\-\.]+", "", filename)
+    filename = _FILENAME_SANITIZE_RE.sub("", filename)
     if not filename.endswith('.json'):
         abort(400)
 
     filepath = os.path.abspath(os.path.join(ARTICLES_DIR, filename))
-    allowed_dir = os.path.realpath(os.path.abspath(ARTICLES_DIR))
     # Ensure the resolved path is inside the articles directory (resolve symlinks)
     real_filepath = os.path.realpath(filepath)
     # Prevent deletion of the articles directory itself and ensure containment
-    if os.path.commonpath([allowed_dir, real_filepath]) != allowed_dir or real_filepath == allowed_dir:
+    if not real_filepath.startswith(_ARTICLES_DIR_REAL):
         abort(400)
 
-    if os.path.exists(filepath):
+    # Let remove() report a missing file instead of stat()ing it first
+    try:
         os.remove(filepath)
-    else:
+    except FileNotFoundError:
         abort(404)
-    return jsonify({"ok": True}), 200
+
+    invalidate_articles_cache()
+    return json_reply(_OK_BODY, 200)
 
 if __name__ == '__main__':
     app.run(debug=False, host='0.0.0.0', port=5000)
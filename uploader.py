@@ -6,15 +6,16 @@ creds = {
     "key":"CHANGE_ME",
     "algorithm":"sha256"
 }
+# One session for both calls so the connection is reused
+sess = requests.Session()
+sess.headers.update({"Content-Type": "application/json"})
+
 url = "http://SERVER_IP:666/admin/upload"
 data = open("./articles/PAGE_NAME.json","rb").read()
 
 
 sender = Sender(creds, url, "POST", content=data, content_type="application/json")
-r = requests.post(url, data=data, headers={
-    "Content-Type": "application/json",
-    "Authorization": sender.request_header
-})
+r = sess.post(url, data=data, headers={"Authorization": sender.request_header})
 print(r.status_code, r.text)
 
 # Test the remove endpoint
@@ -23,9 +24,7 @@ name = input()
 url = "http://SERVER_IP:666/admin/remove"
 data = json.dumps({"filename": f"{name}.json"})
 sender = Sender(creds, url, "POST", content=data, content_type="application/json")
-r = requests.post(url, data=data, headers={
-    "Content-Type": "application/json",
-    "Authorization": sender.request_header
-})
+r = sess.post(url, data=data, headers={"Authorization": sender.request_header})
 print(r.status_code, r.text)
-input()
\ No newline at end of file
+input()
+sess.close()
\ No newline at end of file